@@ -1,15 +1,18 @@
+import functools
+import importlib
 import logging
 import os
-import re
 import subprocess
 import time
 from contextlib import contextmanager
-from typing import Union
+from typing import TYPE_CHECKING
 
 import click
 
-from . import _utils, tools
-from .parsers import InputParser
+from . import _utils
+
+if TYPE_CHECKING:
+	from .parsers import InputParser
 
 __all__ = [
 	"get_input",
@@ -24,19 +27,69 @@ __all__ = [
 	"day",
 ]
 
+_logger = logging.getLogger(__name__)
+
 # --- Test Mode Initialization ---
 TEST_MODE = os.getenv("AOC_TEST_MODE") == "true"
 _test_input_data = os.getenv("AOC_TEST_INPUT")
 _test_expected_answer = os.getenv("AOC_TEST_OUTPUT")
 
+# --- Timing Initialization ---
+TIME_IT = os.getenv("AOC_TIME_IT") == "true"
+
+
+# --- LAZY ATTRIBUTES ---
+def __getattr__(name: str):
+	"""Resolves the puzzle context and heavy submodules on first access."""
+	if name in ("year", "day"):
+		_resolve_context()
+		return globals()[name]
+	if name == "tools":
+		return importlib.import_module(".tools", __name__)
+	if name == "InputParser":
+		from .parsers import InputParser
+
+		return InputParser
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # --- CONTEXT DETERMINATION ---
-context: Union[tuple[int, int], None] = _utils.read_context()
-if context:
-	year, day = context
-	logging.getLogger(__name__).info(f"Using persisted context: Year {year}, Day {day}")
-else:
-	year, day = _utils.get_latest_puzzle_date()
-	logging.getLogger(__name__).info("No context set. Defaulting to latest puzzle.")
+def _resolve_context() -> tuple[int, int]:
+	"""
+	Returns the current puzzle context (year, day).
+	It is determined on first use and stored as the module's `year` and `day`.
+	In Test Mode, get_input() and submit() return before needing it.
+	"""
+	global year, day
+	if "year" not in globals() or "day" not in globals():
+		context = _utils.read_context()
+		if context:
+			year, day = context
+			_logger.info(f"Using persisted context: Year {year}, Day {day}")
+		else:
+			year, day = _utils.get_latest_puzzle_date()
+			_logger.info("No context set. Defaulting to latest puzzle.")
+	return year, day
+
+
+# --- PRIVATE HELPERS ---
+@functools.lru_cache(maxsize=None)
+def _ruff_bin() -> str:
+	"""Resolves the ruff executable, preferring the one bundled with the package."""
+	try:
+		from ruff.__main__ import find_ruff_bin
+
+		return find_ruff_bin()
+	except (ImportError, FileNotFoundError):
+		return "ruff"
+
+
+def _is_bind_call(line: bytes) -> bool:
+	"""Checks whether a notepad line is a single-line `aoc.bind(...)` call."""
+	stripped = line.strip()
+	if not stripped.startswith(b"aoc.bind") or not stripped.endswith(b")"):
+		return False
+	return stripped[len(b"aoc.bind") :].lstrip().startswith(b"(")
 
 
 # --- PUBLIC FUNCTIONS ---
@@ -47,13 +100,16 @@ def get_instructions() -> str:
 	Returns:
 		A formatted string of the puzzle instructions for the terminal.
 	"""
+	year, day = _resolve_context()
 	return _utils.get_aoc_data(year, day, data_type="instructions")
 
 
-def get_input_parser() -> InputParser:
+def get_input_parser() -> "InputParser":
 	"""
 	Returns a fluent InputParser object for advanced input processing.
 	"""
+	from .parsers import InputParser
+
 	return InputParser(get_input())
 
 
@@ -62,11 +118,11 @@ def get_input() -> str:
 	Gets the puzzle input for the current context (year, day).
 	In Test Mode, this returns the example input instead.
 	"""
-	logger = logging.getLogger(__name__)
 	if TEST_MODE:
-		logger.info("TEST MODE: Returning example input.")
+		_logger.info("TEST MODE: Returning example input.")
 		return _test_input_data if _test_input_data is not None else ""
 
+	year, day = _resolve_context()
 	return _utils.get_aoc_data(year, day, data_type="input")
 
 
@@ -76,56 +132,47 @@ def submit(answer, part: int) -> str:
 	The puzzle part (1 or 2) must be provided.
 	In Test Mode, this performs a local check against the expected answer.
 	"""
-	logger = logging.getLogger(__name__)
-
 	if TEST_MODE:
-		logger.info(
+		_logger.info(
 			f"TEST MODE: Checking answer '{answer}' against "
 			f"expected '{_test_expected_answer}'."
 		)
-		str_answer = str(answer)
-		str_expected = str(_test_expected_answer)
-
-		if str_answer == str_expected:
+		if str(answer) == str(_test_expected_answer):
 			return "✅ PASSED"
 		else:
 			return (
-				f"❌ FAILED: Got '{str_answer}', but expected '{_test_expected_answer}'"
+				f"❌ FAILED: Got '{answer!s}', but expected '{_test_expected_answer!s}'"
 			)
 
-	if part not in [1, 2]:
+	if part not in (1, 2):
 		err_msg = "The 'part' argument for submit() must be 1 or 2."
-		logger.error(err_msg)
+		_logger.error(err_msg)
 		return err_msg
 
+	year, day = _resolve_context()
 	progress_data = _utils.read_progress_file()
-	year_str = str(year)
 	day_str = str(day)
-
-	if year_str not in progress_data["progress"]:
-		progress_data["progress"][year_str] = {}
-
-	current_stars = progress_data["progress"][year_str].get(day_str, 0)
+	year_progress = progress_data["progress"].setdefault(str(year), {})
+	current_stars = year_progress.get(day_str, 0)
 	str_answer = str(answer)
 
 	# If the puzzle part is already completed, check against the known correct answer
 	if current_stars >= part:
-		logger.info(
+		_logger.info(
 			f"Part {part} for {year}-{day} is already completed. "
 			"Verifying answer locally."
 		)
-		correct_answers = _utils.scrape_day_page_for_answers(year, day)
-		known_correct_answer = correct_answers.get(part)
+		known_correct_answer = _utils.get_correct_answer(year, day, part)
 
 		if known_correct_answer is not None:
 			if str_answer == known_correct_answer:
-				logger.info(
+				_logger.info(
 					f"Your answer '{str_answer}' is correct! "
 					"(Matches previously submitted answer)"
 				)
 				return f"✅ Your answer '{str_answer}' is correct!"
 			else:
-				logger.warning(
+				_logger.warning(
 					f"Your answer '{str_answer}' is incorrect. "
 					f"The correct answer was '{known_correct_answer}'."
 				)
@@ -134,7 +181,7 @@ def submit(answer, part: int) -> str:
 					f"The correct answer was '{known_correct_answer}'."
 				)
 		else:
-			logger.warning(
+			_logger.warning(
 				"Could not retrieve correct answer from AoC website for verification."
 			)
 			msg = "⚠️ Puzzle already completed"
@@ -143,24 +190,24 @@ def submit(answer, part: int) -> str:
 
 	response_text = _utils.post_answer(year, day, part, answer)
 
-	if "That's the right answer!" in response_text:
-		logger.info("Answer is correct!")
+	if _utils.RIGHT_ANSWER_TEXT in response_text:
+		_logger.info("Answer is correct!")
 
 		new_stars = max(current_stars, part)
-		progress_data["progress"][year_str][day_str] = new_stars
+		year_progress[day_str] = new_stars
 		_utils.write_progress_file(progress_data)
 
 		if _utils.get_bool_config_setting("auto_bind", default=True):
-			logger.info(f"Auto-binding solution for Part {part}...")
+			_logger.info(f"Auto-binding solution for Part {part}...")
 			bind(part)
 		return f"✅ {response_text}"
 
-	elif "You don't seem to be solving the right level" in response_text:
-		logger.warning(f"Part {part} has already been completed.")
+	elif _utils.WRONG_LEVEL_TEXT in response_text:
+		_logger.warning(f"Part {part} has already been completed.")
 
 		new_stars = max(current_stars, part)
-		if progress_data["progress"][year_str].get(day_str) != new_stars:
-			progress_data["progress"][year_str][day_str] = new_stars
+		if year_progress.get(day_str) != new_stars:
+			year_progress[day_str] = new_stars
 			_utils.write_progress_file(progress_data)
 
 		return (
@@ -169,7 +216,7 @@ def submit(answer, part: int) -> str:
 		)
 
 	else:
-		logger.warning(f"Answer is incorrect. Response: {response_text}")
+		_logger.warning(f"Answer is incorrect. Response: {response_text}")
 		return f"❌ {response_text}"
 
 
@@ -179,77 +226,81 @@ def bind(part: int, overwrite: bool = False):
 	The puzzle part (1 or 2) must be provided.
 	The 'aoc.bind()' call is automatically removed from the saved code.
 	"""
-	logger = logging.getLogger(__name__)
-	if part not in [1, 2]:
-		logger.error("The 'part' argument for bind() must be 1 or 2.")
+	if part not in (1, 2):
+		_logger.error("The 'part' argument for bind() must be 1 or 2.")
 		return
 
+	year, day = _resolve_context()
 	source_path = _utils.NOTEPAD_PATH
 	dest_dir = _utils.SOLUTIONS_DIR / str(year) / f"{day:02d}"
 	dest_path = dest_dir / f"part_{part}.py"
 
-	logger.info(f"Binding solution for {year}-{day} Part {part}...")
+	_logger.info(f"Binding solution for {year}-{day} Part {part}...")
 
 	if not source_path.exists():
-		logger.error("notepad.py not found!")
+		_logger.error("notepad.py not found!")
 		return
 
 	if _utils.get_bool_config_setting("auto_format_on_bind", default=True):
-		logger.info(f"Auto-formatting {source_path} with ruff...")
+		_logger.info(f"Auto-formatting {source_path} with ruff...")
 		try:
-			subprocess.run(["ruff", "format", str(source_path)], check=True)
+			subprocess.run([_ruff_bin(), "format", str(source_path)], check=True)
 		except (subprocess.CalledProcessError, FileNotFoundError) as e:
-			logger.error(f"Failed to format notepad.py with ruff: {e}")
-			logger.warning("Proceeding to bind the unformatted file.")
+			_logger.error(f"Failed to format notepad.py with ruff: {e}")
+			_logger.warning("Proceeding to bind the unformatted file.")
 
 	if dest_path.exists() and not overwrite:
-		logger.warning(
+		_logger.warning(
 			f"Solution already exists at {dest_path}. "
 			f"Use bind(overwrite=True, part={part}) to replace it."
 		)
 		return
 
 	try:
-		content = source_path.read_text()
-		bind_pattern = re.compile(r"^\s*aoc\.bind\s*\(.*\)\s*$", re.MULTILINE)
-		cleaned_content = re.sub(bind_pattern, "", content).rstrip()
+		content = source_path.read_bytes()
+		# Only split into lines when there is a bind call to strip
+		if b"aoc.bind" in content:
+			content = b"".join(
+				line
+				for line in content.splitlines(keepends=True)
+				if not _is_bind_call(line)
+			)
+		cleaned_content = content.rstrip()
 
 		dest_dir.mkdir(parents=True, exist_ok=True)
-		dest_path.write_text(cleaned_content)
-		logger.info(f"Solution successfully saved to {dest_path}")
+		dest_path.write_bytes(cleaned_content)
+		_logger.info(f"Solution successfully saved to {dest_path}")
 
 		if _utils.get_bool_config_setting("auto_commit_on_bind"):
 			_utils.git_commit_solution(year, day, part)
 
 		if _utils.get_bool_config_setting("auto_clear_on_bind"):
-			logger.info("Auto-clearing notepad.py...")
+			_logger.info("Auto-clearing notepad.py...")
 			clear()
 
 	except Exception as e:
-		logger.error(f"Failed to bind solution: {e}")
+		_logger.error(f"Failed to bind solution: {e}")
 
 
 def clear():
 	"""Clears all content from the notepad.py file."""
-	logger = logging.getLogger(__name__)
 	if _utils.NOTEPAD_PATH.exists():
 		_utils.NOTEPAD_PATH.write_text("")
-		logger.info("notepad.py has been cleared.")
+		_logger.info("notepad.py has been cleared.")
 
 
 @contextmanager
 def timed():
 	"""A context manager to time code, activated by `aoc run -t`."""
-	should_time = os.getenv("AOC_TIME_IT") == "true"
-	start_time = 0
+	start_ns = 0
 
-	if should_time:
-		start_time = time.perf_counter()
+	if TIME_IT:
+		start_ns = time.perf_counter_ns()
 
 	try:
 		yield
 	finally:
-		if should_time:
-			end_time = time.perf_counter()
-			duration_ms = (end_time - start_time) * 1000
+		if TIME_IT:
+			end_ns = time.perf_counter_ns()
+			duration_ms = (end_ns - start_ns) / 1_000_000
 			click.secho(f"\n⏱️  Execution time: {duration_ms:.2f} ms", fg="yellow")
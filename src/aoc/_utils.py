@@ -1,9 +1,13 @@
 import configparser
 import datetime
+import functools
 import json
 import logging
+import os
 import shutil
+import stat
 import subprocess
+import tempfile
 from pathlib import Path
 
 import click
@@ -28,6 +32,10 @@ CONTEXT_FILE_PATH = PROJECT_ROOT / ".context.json"
 PERF_CACHE_PATH = CACHE_DIR / "performance.json"
 AOC_BASE_URL = "https://adventofcode.com"
 
+# Markers in the server's response to an answer submission
+RIGHT_ANSWER_TEXT = "That's the right answer!"
+WRONG_LEVEL_TEXT = "You don't seem to be solving the right level"
+
 
 def read_context() -> tuple[int, int] | None:
 	"""Reads the persisted year and day from the context file."""
@@ -81,21 +89,36 @@ def _write_answers_cache(year: int, day: int, data: dict):
 		json.dump(data, f, indent=2)
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_config(path: Path, mtime_ns: int, size: int) -> configparser.ConfigParser:
+	"""Parses the config file. Cached until the file's mtime or size changes."""
+	config = configparser.ConfigParser()
+	config.read(path)
+	return config
+
+
+def _read_config() -> configparser.ConfigParser | None:
+	"""Returns the parsed config file, or None if it doesn't exist."""
+	try:
+		file_stat = CONFIG_FILE_PATH.stat()
+	except FileNotFoundError:
+		return None
+	return _parse_config(CONFIG_FILE_PATH, file_stat.st_mtime_ns, file_stat.st_size)
+
+
 def get_session_cookie() -> str | None:
 	"""Reads the session cookie from the config file."""
-	if not CONFIG_FILE_PATH.exists():
+	config = _read_config()
+	if config is None:
 		return None
-	config = configparser.ConfigParser()
-	config.read(CONFIG_FILE_PATH)
 	return config.get("user", "session_cookie", fallback=None)
 
 
 def get_bool_config_setting(key: str, default: bool = False) -> bool:
 	"""Reads a boolean setting from the [user] section of the config file."""
-	if not CONFIG_FILE_PATH.exists():
+	config = _read_config()
+	if config is None:
 		return default
-	config = configparser.ConfigParser()
-	config.read(CONFIG_FILE_PATH)
 	return config.getboolean("user", key, fallback=default)
 
 
@@ -244,9 +267,7 @@ def post_answer(year: int, day: int, part: int, answer) -> str:
 		logger.warning(
 			f"Correct answer for Part {part} is already known. Submission cancelled."
 		)
-		return (
-			"You don't seem to be solving the right level. Did you already complete it?"
-		)
+		return f"{WRONG_LEVEL_TEXT}. Did you already complete it?"
 
 	# 2. If not in cache, proceed with web submission
 	logger.info(f"Answer '{str_answer}' not in cache. Submitting to AoC website.")
@@ -283,7 +304,7 @@ def post_answer(year: int, day: int, part: int, answer) -> str:
 		{"answer": str_answer, "result": response_text}
 	)
 	# If correct, also store it in the 'correct_answer' field
-	if "That's the right answer!" in response_text:
+	if RIGHT_ANSWER_TEXT in response_text:
 		cached_data[part_key]["correct_answer"] = str_answer
 
 	_write_answers_cache(year, day, cached_data)
@@ -389,6 +410,30 @@ def scrape_day_page_for_answers(year: int, day: int) -> dict[int, str]:
 	return answers
 
 
+def get_correct_answer(year: int, day: int, part: int) -> str | None:
+	"""
+	Gets the correct answer for a completed puzzle part.
+	Answers are read from the answers.json cache first; the day page is only
+	scraped when the answer isn't cached yet, and any answers found are saved.
+	"""
+	part_key = f"part_{part}"
+	answers_cache = _read_answers_cache(year, day)
+	cached_answer = answers_cache.get(part_key, {}).get("correct_answer")
+	if cached_answer is not None:
+		logger.info(f"Loaded correct answer for {year}-{day} Part {part} from cache.")
+		return cached_answer
+
+	correct_answers = scrape_day_page_for_answers(year, day)
+	if correct_answers:
+		for scraped_part, answer in correct_answers.items():
+			answers_cache.setdefault(
+				f"part_{scraped_part}", {"correct_answer": None, "submissions": []}
+			)["correct_answer"] = answer
+		_write_answers_cache(year, day, answers_cache)
+
+	return correct_answers.get(part)
+
+
 def _read_tests_cache(year: int, day: int) -> dict:
 	"""Reads the tests.json cache for a given day."""
 	cache_file = CACHE_DIR / str(year) / f"{day:02d}" / "tests.json"
@@ -526,6 +571,28 @@ def read_progress_file() -> dict:
 
 
 def write_progress_file(data: dict):
-	"""Writes data to the progress.json file."""
-	with open(PROGRESS_JSON_PATH, "w") as f:
-		json.dump(data, f, indent=2, sort_keys=True)
+	"""Atomically writes data to the progress.json file."""
+	# The temp file is created 0600; give it the mode a plain write would have
+	try:
+		mode = stat.S_IMODE(PROGRESS_JSON_PATH.stat().st_mode)
+	except FileNotFoundError:
+		umask = os.umask(0)
+		os.umask(umask)
+		mode = 0o666 & ~umask
+
+	tmp_file = tempfile.NamedTemporaryFile(
+		"w",
+		dir=PROGRESS_JSON_PATH.parent,
+		prefix=".progress.",
+		suffix=".tmp",
+		delete=False,
+	)
+	try:
+		with tmp_file as f:
+			json.dump(data, f, indent=2, sort_keys=True)
+		os.chmod(tmp_file.name, mode)
+		os.replace(tmp_file.name, PROGRESS_JSON_PATH)
+	finally:
+		# Only still there if something (including Ctrl-C) interrupted the write
+		if os.path.exists(tmp_file.name):
+			os.unlink(tmp_file.name)
@@ -14,9 +14,13 @@ def context_group():
 @click.option("-d", "--day", type=int, required=True, help="The puzzle day to set.")
 def context_set(year, day):
 	"""Sets and saves the puzzle context with validation."""
+	# The day range is fixed, so check it before working out the latest puzzle
+	if not 1 <= day <= 25:
+		click.secho("Error: Day must be between 1 and 25.", fg="red")
+		raise click.Abort()
+
 	latest_year, latest_day = _utils.get_latest_puzzle_date()
 
-	# Validate the requested date
 	if not 2015 <= year <= latest_year:
 		click.secho(
 			f"Error: Year must be between 2015 and {latest_year}.",
@@ -24,10 +28,6 @@ def context_set(year, day):
 		)
 		raise click.Abort()
 
-	if not 1 <= day <= 25:
-		click.secho("Error: Day must be between 1 and 25.", fg="red")
-		raise click.Abort()
-
 	if year == latest_year and day > latest_day:
 		click.secho(
 			f"Error: Puzzle for {year}-{day:02d} is not yet available.",
@@ -3,6 +3,44 @@ import pytest
 import aoc
 from aoc import _utils
 
+# --- Tests for the lazy puzzle context ---
+
+
+def test_context_resolved_on_first_access(monkeypatch):
+	"""Tests that year and day are read from the persisted context when accessed."""
+	# Arrange: Forget any previously resolved context
+	monkeypatch.setattr(aoc, "year", 0)
+	monkeypatch.setattr(aoc, "day", 0)
+	monkeypatch.delattr(aoc, "year")
+	monkeypatch.delattr(aoc, "day")
+	monkeypatch.setattr(_utils, "read_context", lambda: (2019, 7))
+
+	# Act & Assert
+	assert (aoc.year, aoc.day) == (2019, 7)
+
+
+def test_test_mode_does_not_resolve_context(monkeypatch):
+	"""Tests that input and submit in test mode never determine the context."""
+	# Arrange: Forget any previously resolved context
+	monkeypatch.setattr(aoc, "year", 0)
+	monkeypatch.setattr(aoc, "day", 0)
+	monkeypatch.delattr(aoc, "year")
+	monkeypatch.delattr(aoc, "day")
+	monkeypatch.setattr(aoc, "TEST_MODE", True)
+	monkeypatch.setattr(aoc, "_test_input_data", "test_input")
+	monkeypatch.setattr(aoc, "_test_expected_answer", "42")
+
+	def fail():
+		pytest.fail("The context should not be resolved in test mode")
+
+	monkeypatch.setattr(_utils, "read_context", fail)
+	monkeypatch.setattr(_utils, "get_latest_puzzle_date", fail)
+
+	# Act & Assert
+	assert aoc.get_input() == "test_input"
+	assert aoc.submit(42, part=1) == "✅ PASSED"
+
+
 # --- Tests for get_input() ---
 
 
@@ -71,6 +109,7 @@ def test_submit_normal_mode(monkeypatch):
 	monkeypatch.setattr(
 		_utils, "read_progress_file", lambda: {"progress": {}}
 	)  # Ensure not marked as completed
+	monkeypatch.setattr(_utils, "write_progress_file", lambda data: None)
 
 	# Act
 	result = aoc.submit("any_answer", part=1)
@@ -79,12 +118,13 @@ def test_submit_normal_mode(monkeypatch):
 	assert "✅ That's the right answer!" in result
 
 
-def test_submit_already_completed_correct_answer(monkeypatch):
+def test_submit_already_completed_correct_answer(monkeypatch, tmp_path):
 	"""Tests submit() when puzzle is already completed and new answer is correct."""
 	# Arrange
 	monkeypatch.setattr(aoc, "TEST_MODE", False)
 	monkeypatch.setattr(aoc, "year", 2025)
 	monkeypatch.setattr(aoc, "day", 1)
+	monkeypatch.setattr(_utils, "CACHE_DIR", tmp_path)
 	# Simulate puzzle being completed (2 stars for day 1)
 	monkeypatch.setattr(
 		_utils, "read_progress_file", lambda: {"progress": {"2025": {"1": 2}}}
@@ -109,12 +149,13 @@ def test_submit_already_completed_correct_answer(monkeypatch):
 	assert "✅ Your answer 'known_correct_part1' is correct!" in result
 
 
-def test_submit_already_completed_incorrect_answer(monkeypatch):
+def test_submit_already_completed_incorrect_answer(monkeypatch, tmp_path):
 	"""Tests submit() when puzzle is already completed and new answer is incorrect."""
 	# Arrange
 	monkeypatch.setattr(aoc, "TEST_MODE", False)
 	monkeypatch.setattr(aoc, "year", 2025)
 	monkeypatch.setattr(aoc, "day", 1)
+	monkeypatch.setattr(_utils, "CACHE_DIR", tmp_path)
 	# Simulate puzzle being completed (2 stars for day 1)
 	monkeypatch.setattr(
 		_utils, "read_progress_file", lambda: {"progress": {"2025": {"1": 2}}}
@@ -142,12 +183,13 @@ def test_submit_already_completed_incorrect_answer(monkeypatch):
 	)
 
 
-def test_submit_already_completed_no_scraped_answer(monkeypatch):
+def test_submit_already_completed_no_scraped_answer(monkeypatch, tmp_path):
 	"""Tests submit() when puzzle is completed but correct answer cannot be scraped."""
 	# Arrange
 	monkeypatch.setattr(aoc, "TEST_MODE", False)
 	monkeypatch.setattr(aoc, "year", 2025)
 	monkeypatch.setattr(aoc, "day", 1)
+	monkeypatch.setattr(_utils, "CACHE_DIR", tmp_path)
 	# Simulate puzzle being completed (2 stars for day 1)
 	monkeypatch.setattr(
 		_utils, "read_progress_file", lambda: {"progress": {"2025": {"1": 2}}}
@@ -169,3 +211,58 @@ def test_submit_already_completed_no_scraped_answer(monkeypatch):
 		"⚠️ Puzzle already completed, but could not verify answer against AoC website."
 		in result
 	)
+
+
+# --- Tests for bind() ---
+
+
+def test_bind_strips_bind_call(monkeypatch, tmp_path):
+	"""Tests that bind() removes the aoc.bind() line from the archived code."""
+	# Arrange
+	notepad = tmp_path / "notepad.py"
+	notepad.write_text(
+		"import aoc\n\naoc.bind(1)\nprint(aoc.binder(1))\n"
+		'aoc.bind(part=int("1"))\n  aoc.bind (part=2)  \n'
+	)
+	monkeypatch.setattr(_utils, "NOTEPAD_PATH", notepad)
+	monkeypatch.setattr(_utils, "SOLUTIONS_DIR", tmp_path / "solutions")
+	monkeypatch.setattr(
+		_utils, "get_bool_config_setting", lambda key, default=False: False
+	)
+	monkeypatch.setattr(aoc, "year", 2025)
+	monkeypatch.setattr(aoc, "day", 1)
+
+	# Act
+	aoc.bind(1)
+
+	# Assert
+	saved = tmp_path / "solutions" / "2025" / "01" / "part_1.py"
+	assert saved.read_text() == "import aoc\n\nprint(aoc.binder(1))"
+
+
+def test_submit_already_completed_uses_cached_answer(monkeypatch, tmp_path):
+	"""Tests submit() verifies against the answers cache without scraping."""
+	# Arrange
+	monkeypatch.setattr(aoc, "TEST_MODE", False)
+	monkeypatch.setattr(aoc, "year", 2025)
+	monkeypatch.setattr(aoc, "day", 1)
+	monkeypatch.setattr(_utils, "CACHE_DIR", tmp_path)
+	monkeypatch.setattr(
+		_utils, "read_progress_file", lambda: {"progress": {"2025": {"1": 2}}}
+	)
+	monkeypatch.setattr(
+		_utils,
+		"scrape_day_page_for_answers",
+		lambda y, d: {1: "known_correct_part1", 2: "known_correct_part2"},
+	)
+	# Act: The first submit scrapes and caches, the second must not scrape
+	aoc.submit("known_correct_part1", part=1)
+	monkeypatch.setattr(
+		_utils,
+		"scrape_day_page_for_answers",
+		lambda *args: pytest.fail("scrape_day_page_for_answers should not be called"),
+	)
+	result = aoc.submit("known_correct_part2", part=2)
+
+	# Assert
+	assert "✅ Your answer 'known_correct_part2' is correct!" in result
@@ -52,6 +52,24 @@ def test_context_set_invalid_day_fails():
 	assert "Error: Day must be between 1 and 25." in result.output
 
 
+def test_context_set_invalid_day_skips_latest_date(monkeypatch):
+	"""Tests that an invalid day is rejected before the latest date is looked up."""
+	# Arrange
+	runner = CliRunner()
+
+	def fail():
+		raise AssertionError("get_latest_puzzle_date should not be called")
+
+	monkeypatch.setattr(_utils, "get_latest_puzzle_date", fail)
+
+	# Act
+	result = runner.invoke(cli, ["context", "set", "--year", "2022", "--day", "0"])
+
+	# Assert
+	assert result.exit_code != 0
+	assert "Error: Day must be between 1 and 25." in result.output
+
+
 def test_context_set_invalid_year_fails():
 	"""Tests that `aoc context set` fails for a year before 2015."""
 	# Arrange
@@ -1,3 +1,8 @@
+import json
+import stat
+
+import pytest
+
 from aoc import _utils
 
 
@@ -55,3 +60,54 @@ def test_post_answer(monkeypatch, requests_mock):
 
 	# Assert
 	assert response == "That's the right answer!"
+
+
+def test_bool_config_setting_rereads_modified_file(monkeypatch, tmp_path):
+	"""Tests that cached config settings are refreshed when the file changes."""
+	# Arrange
+	fake_config_path = tmp_path / "config.ini"
+	monkeypatch.setattr(_utils, "CONFIG_FILE_PATH", fake_config_path)
+	fake_config_path.write_text("[user]\nauto_bind = true\n")
+
+	# Act & Assert
+	assert _utils.get_bool_config_setting("auto_bind") is True
+	fake_config_path.write_text("[user]\nauto_bind = false\n")
+	assert _utils.get_bool_config_setting("auto_bind") is False
+
+
+def test_write_progress_file_replaces_atomically(monkeypatch, tmp_path):
+	"""Tests that progress data is written at once, without leftover temp files."""
+	# Arrange
+	fake_progress_path = tmp_path / "progress.json"
+	monkeypatch.setattr(_utils, "PROGRESS_JSON_PATH", fake_progress_path)
+	fake_progress_path.write_text('{"progress": {}}')
+	fake_progress_path.chmod(0o644)
+	data = {"progress": {"2025": {"1": 2}}}
+
+	# Act
+	_utils.write_progress_file(data)
+
+	# Assert
+	assert json.loads(fake_progress_path.read_text()) == data
+	assert _utils.read_progress_file() == data
+	assert [p.name for p in tmp_path.iterdir()] == ["progress.json"]
+	assert stat.S_IMODE(fake_progress_path.stat().st_mode) == 0o644
+
+
+def test_write_progress_file_cleans_up_on_interrupt(monkeypatch, tmp_path):
+	"""Tests that an interrupted progress write leaves no temp file behind."""
+	# Arrange
+	fake_progress_path = tmp_path / "progress.json"
+	monkeypatch.setattr(_utils, "PROGRESS_JSON_PATH", fake_progress_path)
+
+	def interrupt(*args, **kwargs):
+		raise KeyboardInterrupt
+
+	monkeypatch.setattr(_utils.json, "dump", interrupt)
+
+	# Act
+	with pytest.raises(KeyboardInterrupt):
+		_utils.write_progress_file({"progress": {}})
+
+	# Assert
+	assert list(tmp_path.iterdir()) == []